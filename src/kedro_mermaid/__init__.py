@@ -1,3 +1,23 @@
+from .api import (
+    DiagramOptions,
+    PipelineFilters,
+    build_graph,
+    check_file,
+    clear_caches,
+    generate_output,
+)
+from .lib.graph import shutdown_executors
+from .lib.snapshot import PipelineSnapshot
 from .plugin import commands
 
-__all__ = ["commands"]
+__all__ = [
+    "DiagramOptions",
+    "PipelineFilters",
+    "PipelineSnapshot",
+    "build_graph",
+    "check_file",
+    "clear_caches",
+    "commands",
+    "generate_output",
+    "shutdown_executors",
+]
@@ -0,0 +1,274 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as package_version
+from typing import Any, cast
+
+import kedro
+from kedro.pipeline import Pipeline
+from omegaconf import OmegaConf
+from packaging import version
+
+from kedro_mermaid.lib.diagram_output import (
+    DIAGRAM_OUTPUTS,
+    read_fingerprint,
+)
+from kedro_mermaid.lib.graph import PARALLEL_MIN_COMPONENT_SIZE, DiagramGraph
+from kedro_mermaid.lib.parsed_name import parse_name_cached
+from kedro_mermaid.lib.snapshot import PipelineSnapshot
+
+# Kedro < 1.0 names the namespace filter 'node_namespace' instead of 'node_namespaces'
+LEGACY_NAMESPACE_FILTER = version.parse(kedro.__version__) < version.parse("1.0.0")
+
+GRAPH_CACHE_SIZE = 128
+
+# LRU cache of simplified graphs, keyed on the snapshot and DiagramOptions.cache_key
+_graph_cache: OrderedDict[tuple[PipelineSnapshot, str], DiagramGraph] = OrderedDict()
+_graph_cache_lock = threading.Lock()
+
+try:
+    PACKAGE_VERSION = package_version("kedro-mermaid")
+except PackageNotFoundError:
+    PACKAGE_VERSION = "unknown"
+
+
+def parse_dotlist(dotlist: Sequence[str] | None) -> dict:
+    config = OmegaConf.from_dotlist(list(dotlist or []))
+    return cast(dict, OmegaConf.to_container(config, resolve=True))
+
+
+@dataclass(frozen=True)
+class PipelineFilters:
+    from_inputs: Sequence[str] | None = None
+    to_outputs: Sequence[str] | None = None
+    from_nodes: Sequence[str] | None = None
+    to_nodes: Sequence[str] | None = None
+    nodes: Sequence[str] | None = None
+    tags: Sequence[str] | None = None
+    namespaces: Sequence[str] | None = None
+
+    def is_empty(self) -> bool:
+        return all(getattr(self, f.name) is None for f in fields(self))
+
+    def apply(self, pipeline: Pipeline) -> Pipeline:
+        filter_args: dict[str, Any] = {
+            "tags": self.tags,
+            "from_nodes": self.from_nodes,
+            "to_nodes": self.to_nodes,
+            "node_names": self.nodes,
+            "from_inputs": self.from_inputs,
+            "to_outputs": self.to_outputs,
+            "node_namespaces": self.namespaces,
+        }
+
+        if LEGACY_NAMESPACE_FILTER:
+            filter_args["node_namespace"] = filter_args.pop("node_namespaces")
+
+        return pipeline.filter(**filter_args)
+
+
+@dataclass(frozen=True)
+class DiagramOptions:
+    graph_attrs: dict = field(default_factory=dict)
+    edge_attrs: dict = field(default_factory=dict)
+    node_attrs: dict = field(default_factory=dict)
+    # Only change how the graph is simplified, not the result, so not part of the cache key
+    simplify_workers: int = 1
+    simplify_min_component_size: int = PARALLEL_MIN_COMPONENT_SIZE
+
+    @classmethod
+    def from_dotlists(
+        cls,
+        graph_attrs: Sequence[str] | None = None,
+        edge_attrs: Sequence[str] | None = None,
+        node_attrs: Sequence[str] | None = None,
+        **kwargs,
+    ) -> "DiagramOptions":
+        return cls(
+            graph_attrs=parse_dotlist(graph_attrs),
+            edge_attrs=parse_dotlist(edge_attrs),
+            node_attrs=parse_dotlist(node_attrs),
+            **kwargs,
+        )
+
+    def cache_key(self) -> str:
+        return json.dumps(
+            [self.graph_attrs, self.edge_attrs, self.node_attrs], sort_keys=True
+        )
+
+
+def _simplified_graph(
+    snapshot: PipelineSnapshot, options: DiagramOptions
+) -> DiagramGraph:
+    key = (snapshot, options.cache_key())
+
+    with _graph_cache_lock:
+        if key in _graph_cache:
+            _graph_cache.move_to_end(key)
+            return _graph_cache[key]
+
+    graph = DiagramGraph.from_snapshot(
+        snapshot,
+        attrs=options.graph_attrs,
+        edge_attrs=options.edge_attrs,
+        node_attrs=options.node_attrs,
+    ).simplify(
+        workers=options.simplify_workers,
+        min_component_size=options.simplify_min_component_size,
+    )
+
+    with _graph_cache_lock:
+        _graph_cache[key] = graph
+        while len(_graph_cache) > GRAPH_CACHE_SIZE:
+            _graph_cache.popitem(last=False)
+
+    return graph
+
+
+def _resolve_snapshot(
+    source: Pipeline | PipelineSnapshot,
+    filters: PipelineFilters,
+) -> PipelineSnapshot:
+    if isinstance(source, PipelineSnapshot):
+        if not filters.is_empty():
+            raise ValueError(
+                "Filters cannot be applied to a PipelineSnapshot. Filter the pipeline before taking the snapshot."
+            )
+        return source
+
+    return PipelineSnapshot.from_pipeline(filters.apply(source))
+
+
+def compute_fingerprint(
+    snapshot: PipelineSnapshot,
+    options: DiagramOptions,
+    format_attrs: dict | None = None,
+) -> str:
+    """Hash everything the inserted diagram depends on, without building the graph.
+
+    The package version is included so that an upgrade changing the rendering
+    invalidates every stored fingerprint.
+
+    Args:
+        snapshot: The snapshot of the filtered pipeline.
+        options: Graph, edge and node attributes of the diagram.
+        format_attrs: Keyword arguments of the output format. The file path is ignored.
+
+    Returns:
+        A short hexadecimal fingerprint.
+    """
+    format_attrs = {
+        key: value
+        for key, value in (format_attrs or {}).items()
+        if key not in {"file_path", "fingerprint"}
+    }
+    payload = json.dumps(
+        [PACKAGE_VERSION, snapshot.edges, options.cache_key(), format_attrs],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def build_graph(
+    source: Pipeline | PipelineSnapshot,
+    *,
+    filters: PipelineFilters | None = None,
+    options: DiagramOptions | None = None,
+) -> DiagramGraph:
+    """Build the simplified diagram graph for a pipeline or a snapshot.
+
+    Graphs are cached per snapshot and options, so the returned graph is shared
+    between callers and must not be mutated.
+
+    Args:
+        source: The pipeline to draw, or a snapshot of an already filtered pipeline.
+        filters: Kedro filters applied to the pipeline before drawing it.
+        options: Graph, edge and node attributes of the diagram.
+
+    Returns:
+        The simplified diagram graph.
+    """
+    snapshot = _resolve_snapshot(source, filters or PipelineFilters())
+    return _simplified_graph(snapshot, options or DiagramOptions())
+
+
+def generate_output(
+    source: Pipeline | PipelineSnapshot,
+    output_format: str = "diagram",
+    *,
+    filters: PipelineFilters | None = None,
+    options: DiagramOptions | None = None,
+    format_attrs: dict | None = None,
+) -> str:
+    """Generate a diagram output for a pipeline or a snapshot, without going through the CLI.
+
+    Args:
+        source: The pipeline to draw, or a snapshot of an already filtered pipeline.
+        output_format: One of the keys of `DIAGRAM_OUTPUTS`.
+        filters: Kedro filters applied to the pipeline before drawing it.
+        options: Graph, edge and node attributes of the diagram.
+        format_attrs: Keyword arguments of the output format.
+
+    Returns:
+        The rendered diagram, encoded diagram, URL or status message of the output format.
+
+    Raises:
+        ValueError: If the output format is unknown.
+    """
+    if output_format not in DIAGRAM_OUTPUTS:
+        raise ValueError(
+            f"Unknown output format '{output_format}'. Available formats: {list(DIAGRAM_OUTPUTS.keys())}"
+        )
+
+    options = options or DiagramOptions()
+    format_attrs = format_attrs or {}
+    snapshot = _resolve_snapshot(source, filters or PipelineFilters())
+
+    if output_format == "insert_to_file":
+        format_attrs = {
+            **format_attrs,
+            "fingerprint": compute_fingerprint(snapshot, options, format_attrs),
+        }
+
+    graph = _simplified_graph(snapshot, options)
+    return DIAGRAM_OUTPUTS[output_format](graph, **format_attrs)
+
+
+def check_file(
+    source: Pipeline | PipelineSnapshot,
+    *,
+    filters: PipelineFilters | None = None,
+    options: DiagramOptions | None = None,
+    format_attrs: dict,
+) -> bool:
+    """Check whether the diagram inserted in a file is current, leaving the file untouched.
+
+    Only the fingerprint stored after the start marker is read and compared, the
+    diagram is never built. A stale or missing fingerprint fails the check, exactly
+    when `insert_to_file` would rewrite the file.
+
+    Args:
+        source: The pipeline to draw, or a snapshot of an already filtered pipeline.
+        filters: Kedro filters applied to the pipeline before drawing it.
+        options: Graph, edge and node attributes of the diagram.
+        format_attrs: Keyword arguments of `insert_to_file`, including `file_path`.
+
+    Returns:
+        Whether the diagram in the file is up to date.
+    """
+    options = options or DiagramOptions()
+    snapshot = _resolve_snapshot(source, filters or PipelineFilters())
+
+    return read_fingerprint(**format_attrs) == compute_fingerprint(
+        snapshot, options, format_attrs
+    )
+
+
+def clear_caches() -> None:
+    with _graph_cache_lock:
+        _graph_cache.clear()
+    parse_name_cached.cache_clear()
@@ -1,15 +1,19 @@
 from typing import cast
 
 import click
-import kedro
 from kedro.framework.project import pipelines
 from kedro.framework.startup import ProjectMetadata
 from kedro.pipeline import Pipeline
-from omegaconf import OmegaConf
-from packaging import version
 
+from kedro_mermaid.api import (
+    DiagramOptions,
+    PipelineFilters,
+    check_file,
+    generate_output,
+    parse_dotlist,
+)
 from kedro_mermaid.lib.diagram_output import DIAGRAM_OUTPUTS
-from kedro_mermaid.lib.graph import DiagramGraph
+from kedro_mermaid.lib.graph import PARALLEL_MIN_COMPONENT_SIZE
 from kedro_mermaid.lib.utils import parse_list
 
 
@@ -93,6 +97,24 @@ from kedro_mermaid.lib.utils import parse_list
     multiple=True,
     help="Set format-specific attributes depending on the chosen output format.",
 )
+@click.option(
+    "--simplify-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes used to simplify large independent parts of the pipeline.",
+)
+@click.option(
+    "--simplify-min-component-size",
+    type=click.IntRange(min=1),
+    default=PARALLEL_MIN_COMPONENT_SIZE,
+    help="Minimum number of edges for an independent part of the pipeline to be simplified in a separate process.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="With '--format insert_to_file', leave the file untouched and exit with a non-zero code if the diagram is out of date.",
+)
 @click.pass_obj
 def generate(
     metadata: ProjectMetadata,
@@ -103,12 +125,15 @@ def generate(
     to_nodes: list[str] | None,
     nodes: list[str] | None,
     tags: list[str] | None,
-    namespaces: str | None,
+    namespaces: list[str] | None,
     graph_attrs: list[str],
     edge_attrs: list[str],
     node_attrs: list[str],
     output_format: str,
     format_attrs: list[str] | None,
+    simplify_workers: int,
+    simplify_min_component_size: int,
+    check: bool,  # noqa: FBT001
 ):
     pipeline = cast(Pipeline | None, pipelines.get(pipeline_name))
 
@@ -117,33 +142,48 @@ def generate(
             f"Pipeline '{pipeline_name}' not found. Available pipelines: {list(pipelines.keys())}"
         )
 
-    filter_args = {
-        "tags": tags,
-        "from_nodes": from_nodes,
-        "to_nodes": to_nodes,
-        "node_names": nodes,
-        "from_inputs": from_inputs,
-        "to_outputs": to_outputs,
-        "node_namespaces": namespaces,
-    }
+    filters = PipelineFilters(
+        from_inputs=from_inputs,
+        to_outputs=to_outputs,
+        from_nodes=from_nodes,
+        to_nodes=to_nodes,
+        nodes=nodes,
+        tags=tags,
+        namespaces=namespaces,
+    )
+    options = DiagramOptions.from_dotlists(
+        graph_attrs=graph_attrs,
+        edge_attrs=edge_attrs,
+        node_attrs=node_attrs,
+        simplify_workers=simplify_workers,
+        simplify_min_component_size=simplify_min_component_size,
+    )
+    format_attrs_dict = parse_dotlist(format_attrs)
+
+    if check:
+        if output_format != "insert_to_file":
+            raise click.UsageError("'--check' requires '--format insert_to_file'.")
 
-    if version.parse(kedro.__version__) < version.parse("1.0.0"):
-        # Handle the older API where 'node_namespaces' is named 'node_namespace'
-        filter_args["node_namespace"] = filter_args.pop("node_namespaces")
+        file_path = format_attrs_dict.get("file_path")
+        if not file_path:
+            raise click.UsageError(
+                "'--check' requires '--set-format-attr file_path=<path>'."
+            )
 
-    pipeline = pipeline.filter(**filter_args)
+        if not check_file(
+            pipeline, filters=filters, options=options, format_attrs=format_attrs_dict
+        ):
+            click.echo(f"Diagram in file '{file_path}' is out of date.", err=True)
+            raise SystemExit(1)
 
-    graph = DiagramGraph.from_pipeline(
-        pipeline,
-        attrs=OmegaConf.from_dotlist(graph_attrs),
-        edge_attrs=OmegaConf.from_dotlist(edge_attrs),
-        node_attrs=OmegaConf.from_dotlist(node_attrs),
-    ).simplify()
+        click.echo(f"Diagram in file '{file_path}' is up to date.")
+        return
 
-    format_attrs_dict = cast(
-        dict,
-        OmegaConf.to_container(
-            OmegaConf.from_dotlist(format_attrs or []), resolve=True
-        ),
+    output = generate_output(
+        pipeline,
+        output_format,
+        filters=filters,
+        options=options,
+        format_attrs=format_attrs_dict,
     )
-    DIAGRAM_OUTPUTS[output_format](graph, **format_attrs_dict)
+    click.echo(output)
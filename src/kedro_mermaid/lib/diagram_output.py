@@ -1,102 +1,161 @@
+import re
 from pathlib import Path
 from typing import Protocol
 
-import click
-
 from kedro_mermaid.contants import EDIT_URL, IMAGE_URL, VIEW_URL
 from kedro_mermaid.lib.graph import DiagramGraph
 
 
 class DiagramOutputFunction(Protocol):
-    def __call__(self, diagram_graph: DiagramGraph, **kwargs) -> None: ...
+    def __call__(self, diagram_graph: DiagramGraph, **kwargs) -> str: ...
 
 
 class DiagramEncodedOutputFunction(Protocol):
-    def __call__(self, encoded_diagram: str, **kwargs) -> None: ...
+    def __call__(self, encoded_diagram: str, **kwargs) -> str: ...
 
 
 def encoded_output(func: DiagramEncodedOutputFunction) -> DiagramOutputFunction:
-    def wrapper(diagram_graph: DiagramGraph, **kwargs) -> None:
+    def wrapper(diagram_graph: DiagramGraph, **kwargs) -> str:
         diagram_str = diagram_graph.render()
         encoded_diagram = DiagramGraph.encode_diagram(diagram_str)
-        func(encoded_diagram, **kwargs)
+        return func(encoded_diagram, **kwargs)
 
     return wrapper
 
 
-def get_diagram(diagram_graph: DiagramGraph) -> None:
+def get_diagram(diagram_graph: DiagramGraph) -> str:
+    return diagram_graph.render()
+
+
+def get_encoded_diagram(encoded_diagram: str) -> str:
+    return encoded_diagram
+
+
+def get_image_url(encoded_diagram: str, *, url: str = IMAGE_URL) -> str:
+    return url.format(diagram=encoded_diagram)
+
+
+def get_edit_url(encoded_diagram: str, *, url: str = EDIT_URL) -> str:
+    return url.format(diagram=encoded_diagram)
+
+
+def get_view_url(encoded_diagram: str, *, url: str = VIEW_URL) -> str:
+    return url.format(diagram=encoded_diagram)
+
+
+INSERT_TEMPLATE = "{marker_start}\n```mermaid\n{diagram}\n```\nView the diagram on [Mermaid]({view_url}) ([edit on Mermaid]({edit_url}), [view as an image]({image_url}))\n{marker_end}"
+INSERT_MARKER = "kedro-mermaid"
+INSERT_MARKER_START_FORMAT = "<!-- DIAGRAM:START:{marker} -->"
+INSERT_MARKER_END_FORMAT = "<!-- DIAGRAM:END:{marker} -->"
+FINGERPRINT_FORMAT = "<!-- DIAGRAM:FINGERPRINT:{fingerprint} -->"
+FINGERPRINT_REGEX = re.compile(r"<!-- DIAGRAM:FINGERPRINT:(\w+) -->")
+
+
+def _render_marker_block(
+    diagram_graph: DiagramGraph,
+    template: str,
+    marker_start: str,
+    marker_end: str,
+    fingerprint: str | None,
+) -> str:
     diagram_str = diagram_graph.render()
-    click.echo(diagram_str)
+    encoded_diagram = DiagramGraph.encode_diagram(diagram_str)
 
+    result = template.format(
+        marker_start=marker_start,
+        marker_end=marker_end,
+        diagram=diagram_str,
+        edit_url=EDIT_URL.format(diagram=encoded_diagram),
+        view_url=VIEW_URL.format(diagram=encoded_diagram),
+        image_url=IMAGE_URL.format(diagram=encoded_diagram),
+    )
+
+    if fingerprint:
+        result = result.replace(
+            marker_start,
+            f"{marker_start}\n{FINGERPRINT_FORMAT.format(fingerprint=fingerprint)}",
+            1,
+        )
 
-def get_encoded_diagram(encoded_diagram: str) -> None:
-    click.echo(encoded_diagram)
+    return result
 
 
-def get_image_url(encoded_diagram: str, *, url: str = IMAGE_URL) -> None:
-    click.echo(url.format(diagram=encoded_diagram))
+def _read_marked_file(file_path: str, marker_start: str, marker_end: str) -> str:
+    content = Path(file_path).read_text()
 
+    if marker_start not in content or marker_end not in content:
+        raise ValueError(
+            f"Markers '{marker_start}' and '{marker_end}' not found in file '{file_path}'."
+        )
 
-def get_edit_url(encoded_diagram: str, *, url: str = EDIT_URL) -> None:
-    click.echo(url.format(diagram=encoded_diagram))
+    return content
+
+
+def read_fingerprint(
+    *,
+    file_path: str,
+    marker: str = INSERT_MARKER,
+    marker_start_format: str = INSERT_MARKER_START_FORMAT,
+    **kwargs,
+) -> str | None:
+    """
+    Read the fingerprint stored after the start marker.
+    Stops reading the file as soon as the start marker is found.
+
+    Args:
+        file_path: The file containing the diagram
+        marker: The name of the marker
+        marker_start_format: The format of the start marker
+        **kwargs: Other `insert_to_file` arguments, ignored
+
+    Returns:
+        The stored fingerprint, or None if the marker block has none
+
+    Raises:
+        ValueError: If the start marker is not found in the file
+    """
+    marker_start = marker_start_format.format(marker=marker)
 
+    with Path(file_path).open("r") as f:
+        for line in f:
+            if marker_start in line:
+                match = FINGERPRINT_REGEX.fullmatch(next(f, "").strip())
+                return match.group(1) if match else None
 
-def get_view_url(encoded_diagram: str, *, url: str = VIEW_URL) -> None:
-    click.echo(url.format(diagram=encoded_diagram))
+    raise ValueError(f"Marker '{marker_start}' not found in file '{file_path}'.")
 
 
 def insert_to_file(
     diagram_graph: DiagramGraph,
     *,
     file_path: str,
-    template: str = "{marker_start}\n```mermaid\n{diagram}\n```\nView the diagram on [Mermaid]({view_url}) ([edit on Mermaid]({edit_url}), [view as an image]({image_url}))\n{marker_end}",
-    marker: str = "kedro-mermaid",
-    marker_start_format: str = "<!-- DIAGRAM:START:{marker} -->",
-    marker_end_format: str = "<!-- DIAGRAM:END:{marker} -->",
-) -> None:
+    template: str = INSERT_TEMPLATE,
+    marker: str = INSERT_MARKER,
+    marker_start_format: str = INSERT_MARKER_START_FORMAT,
+    marker_end_format: str = INSERT_MARKER_END_FORMAT,
+    fingerprint: str | None = None,
+) -> str:
     marker_start = marker_start_format.format(marker=marker)
     marker_end = marker_end_format.format(marker=marker)
 
-    result = template.format(
-        marker_start=marker_start,
-        marker_end=marker_end,
-        diagram=diagram_graph.render(),
-        edit_url=EDIT_URL.format(
-            diagram=DiagramGraph.encode_diagram(diagram_graph.render())
-        ),
-        view_url=VIEW_URL.format(
-            diagram=DiagramGraph.encode_diagram(diagram_graph.render())
-        ),
-        image_url=IMAGE_URL.format(
-            diagram=DiagramGraph.encode_diagram(diagram_graph.render())
-        ),
+    result = _render_marker_block(
+        diagram_graph, template, marker_start, marker_end, fingerprint
     )
 
-    file = Path(file_path)
-
-    with file.open("r") as f:
-        content = f.read()
-
-        if marker_start not in content or marker_end not in content:
-            raise ValueError(
-                f"Markers '{marker_start}' and '{marker_end}' not found in file '{file_path}'."
-            )
+    content = _read_marked_file(file_path, marker_start, marker_end)
 
-        if result in content:
-            click.echo(
-                f"Diagram already up to date in file '{file_path}'. No changes made."
-            )
-            return
+    if result in content:
+        return f"Diagram already up to date in file '{file_path}'. No changes made."
 
-        pre_content = content.split(marker_start)[0]
-        post_content = content.split(marker_end)[-1]
+    pre_content = content.split(marker_start)[0]
+    post_content = content.split(marker_end)[-1]
 
-    with Path.open(file, "w") as f:
+    with Path(file_path).open("w") as f:
         f.write(pre_content)
         f.write(result)
         f.write(post_content)
 
-    click.echo(f"Diagram inserted into file '{file_path}'.")
+    return f"Diagram inserted into file '{file_path}'."
 
 
 DIAGRAM_OUTPUTS = {
@@ -1,8 +1,12 @@
 import base64
 import json
 import logging
+import multiprocessing
+import threading
 import zlib
 from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import cast
@@ -11,10 +15,48 @@ import yaml
 from kedro.pipeline import Pipeline
 from omegaconf import DictConfig, OmegaConf
 
-from kedro_mermaid.lib.parsed_name import ParsedName, ParsedValue
+from kedro_mermaid.lib.parsed_name import (
+    ParsedName,
+    ParsedValue,
+    parse_name_cached,
+)
+from kedro_mermaid.lib.snapshot import PipelineSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Components with fewer edges than this are simplified in the calling process
+PARALLEL_MIN_COMPONENT_SIZE = 500
+
+_executors: dict[int, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    # Shared across calls, and spawned rather than forked as the caller may be multi-threaded
+    with _executors_lock:
+        if workers not in _executors:
+            _executors[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executors[workers]
+
+
+def _discard_executor(workers: int, executor: ProcessPoolExecutor) -> None:
+    with _executors_lock:
+        if _executors.get(workers) is executor:
+            del _executors[workers]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executors() -> None:
+    """Shut down the worker pools shared by `DiagramGraph.simplify`."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
+
 
 @dataclass
 class DiagramNode:
@@ -30,7 +72,7 @@ class DiagramNode:
 
     @cached_property
     def parsed_name(self) -> ParsedName:
-        return ParsedName.parse_name(self.name, self.pattern)
+        return parse_name_cached(self.name, self.pattern)
 
     def should_include(self) -> bool:
         return self.parsed_name.is_match
@@ -112,32 +154,40 @@ class DiagramGraph:
         edge_attrs: DictConfig,
         node_attrs: DictConfig,
     ) -> "DiagramGraph":
-        attrs_dict = cast(dict, OmegaConf.to_container(attrs, resolve=True))
-        edge_attrs_dict = cast(dict, OmegaConf.to_container(edge_attrs, resolve=True))
-        node_attrs_dict = cast(dict, OmegaConf.to_container(node_attrs, resolve=True))
+        return cls.from_snapshot(
+            PipelineSnapshot.from_pipeline(pipeline),
+            attrs=cast(dict, OmegaConf.to_container(attrs, resolve=True)),
+            edge_attrs=cast(dict, OmegaConf.to_container(edge_attrs, resolve=True)),
+            node_attrs=cast(dict, OmegaConf.to_container(node_attrs, resolve=True)),
+        )
 
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: PipelineSnapshot,
+        attrs: dict,
+        edge_attrs: dict,
+        node_attrs: dict,
+    ) -> "DiagramGraph":
         return cls(
             edges=[
                 DiagramEdge(
                     source=DiagramNode(
                         name=input_name,
-                        **node_attrs_dict,
+                        **node_attrs,
                     ),
                     target=DiagramNode(
                         name=output_name,
-                        **node_attrs_dict,
+                        **node_attrs,
                     ),
-                    **edge_attrs_dict,
+                    **edge_attrs,
                 )
-                for node in pipeline.nodes
-                for input_name in node.inputs
-                for output_name in node.outputs
-                if input_name != output_name
+                for input_name, output_name in snapshot.edges
             ],
-            attrs=attrs_dict,
-            edge_attrs=edge_attrs_dict,
-            node_attrs=node_attrs_dict,
-            **attrs_dict,
+            attrs=attrs,
+            edge_attrs=edge_attrs,
+            node_attrs=node_attrs,
+            **attrs,
         )
 
     @classmethod
@@ -214,7 +264,39 @@ class DiagramGraph:
 
         return reachable
 
-    def simplify(self) -> "DiagramGraph":
+    def _collect_components(
+        self, sources: dict[str, list[DiagramNode]]
+    ) -> list[list[DiagramEdge]]:
+        """
+        Split the edges into weakly connected components.
+
+        Args:
+            sources: The adjacency list representation of the graph
+
+        Returns:
+            The edges of each component, in order of first appearance
+        """
+        parents: dict[str, str] = {}
+
+        def find(node_id: str) -> str:
+            root = node_id
+            while parents.setdefault(root, root) != root:
+                root = parents[root]
+            while parents[node_id] != root:
+                parents[node_id], node_id = root, parents[node_id]
+            return root
+
+        for source_id, targets in sources.items():
+            for target in targets:
+                parents[find(target.id)] = find(source_id)
+
+        components: dict[str, list[DiagramEdge]] = defaultdict(list)
+        for edge in self.edges:
+            components[find(edge.source.id)].append(edge)
+
+        return list(components.values())
+
+    def _simplify_edges(self) -> list[DiagramEdge]:
         sources = self._collect_sources()
 
         included_nodes: list[DiagramNode] = []
@@ -247,13 +329,89 @@ class DiagramGraph:
             # Remove self to avoid self-loops
             reachable_finals.discard(final_node)
 
-            for dest_final in reachable_finals:
+            # Sort so the order does not depend on the process' hash seed
+            for dest_final in sorted(reachable_finals):
                 simplified_edges.append(
                     DiagramEdge(final_node, dest_final, **self.edge_attrs)
                 )
 
+        return simplified_edges
+
+    def simplify(
+        self,
+        *,
+        workers: int = 1,
+        min_component_size: int = PARALLEL_MIN_COMPONENT_SIZE,
+    ) -> "DiagramGraph":
+        """
+        Reconnect the included nodes, skipping the nodes that are not included.
+
+        Each weakly connected component is simplified on its own. When `workers` is
+        greater than one and the graph has more than one component, components with
+        at least `min_component_size` edges are simplified in a process pool while
+        the smaller ones run inline. Results are merged in component order, so the
+        output does not depend on `workers`. The pool is shared between calls until
+        `shutdown_executors` is called, and uses the "spawn" start method, so the
+        main module of the calling program must be safe to import. If a worker dies,
+        the pool is discarded and the affected components are simplified inline.
+
+        Args:
+            workers: Maximum number of worker processes
+            min_component_size: Minimum number of edges for a component to be sent to a worker
+
+        Returns:
+            The simplified graph
+        """
+        components = [
+            DiagramGraph(
+                edges=edges,
+                attrs=self.attrs,
+                edge_attrs=self.edge_attrs,
+                node_attrs=self.node_attrs,
+            )
+            for edges in self._collect_components(self._collect_sources())
+        ]
+        large_components = [
+            index
+            for index, component in enumerate(components)
+            if len(component.edges) >= min_component_size
+        ]
+
+        results: list[list[DiagramEdge] | None] = [None] * len(components)
+        futures: dict[int, Future[list[DiagramEdge]]] = {}
+
+        executor = None
+
+        if workers > 1 and large_components and len(components) > 1:
+            logger.debug(
+                "Simplifying %d of %d components with %d workers",
+                len(large_components),
+                len(components),
+                workers,
+            )
+            executor = _get_executor(workers)
+            try:
+                futures = {
+                    index: executor.submit(components[index]._simplify_edges)
+                    for index in large_components
+                }
+            except BrokenProcessPool:
+                _discard_executor(workers, executor)
+                futures = {}
+
+        for index, component in enumerate(components):
+            if index not in futures:
+                results[index] = component._simplify_edges()
+        for index, future in futures.items():
+            try:
+                results[index] = future.result()
+            except BrokenProcessPool:
+                logger.warning("Worker pool broke, simplifying component inline")
+                _discard_executor(workers, cast(ProcessPoolExecutor, executor))
+                results[index] = components[index]._simplify_edges()
+
         return DiagramGraph(
-            edges=simplified_edges,
+            edges=[edge for edges in results if edges for edge in edges],
             declaration=self.declaration,
             config=self.config,
             attrs=self.attrs,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 import regex
 
@@ -106,3 +107,8 @@ class ParsedName:
             )
 
         return cls.from_name("__".join(match.captures(0)), is_match=True)
+
+
+@lru_cache(maxsize=8192)
+def parse_name_cached(name: str, pattern: str | None = None) -> ParsedName:
+    return ParsedName.parse_name(name, pattern)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from kedro.pipeline import Pipeline
+
+
+@dataclass(frozen=True)
+class PipelineSnapshot:
+    """Hashable view of the dataset edges of a pipeline, used as a cache key."""
+
+    edges: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Pipeline) -> "PipelineSnapshot":
+        return cls(
+            edges=tuple(
+                (input_name, output_name)
+                for node in pipeline.nodes
+                for input_name in node.inputs
+                for output_name in node.outputs
+                if input_name != output_name
+            )
+        )